@@ -1,20 +1,28 @@
 #!/usr/bin/env python3
 """
-Command-line interface for PDF → PNG conversion using logic.py
-cli.py <files-or-folders> --dpi 600 --alpha --overwrite --password "secret"
+Command-line interface for PDF → PNG/JPG/WebP conversion using logic.py
+cli.py <files-or-folders> --dpi 600 --alpha --overwrite --password "secret" --format png --workers 4
 """
 
+from __future__ import annotations
 from typing import List
 import argparse
+import multiprocessing
+import multiprocessing.pool
+import os
 
 # Import the core logic
 import logic
 
 
+# Default number of worker processes (PDFs converted in parallel)
+DEFAULT_WORKERS = min(os.cpu_count() or 1, 4)
+
+
 def _main() -> int:
     # Parse command-line arguments
     parser = argparse.ArgumentParser(
-        description="Convert PDFs to PNG images beside the source files."
+        description="Convert PDFs to PNG/JPG/WebP images beside the source files."
     )
 
     # Positional arguments
@@ -42,7 +50,7 @@ def _main() -> int:
     parser.add_argument(
         "--overwrite",
         action="store_true",
-        help="Overwrite existing PNG files.",
+        help="Overwrite existing image files.",
     )
 
     parser.add_argument(
@@ -52,28 +60,106 @@ def _main() -> int:
         help="Password to open encrypted PDFs (applies to all).",
     )
 
+    parser.add_argument(
+        "--format",
+        dest="fmt",
+        choices=logic.FORMATS,
+        default="png",
+        help="Output image format; jpg/webp encode faster and are smaller for scans "
+             "(jpg has no alpha; webp requires Pillow). Default: png.",
+    )
+
+    parser.add_argument(
+        "--quality",
+        type=int,
+        choices=range(1, 101),
+        default=logic.DEFAULT_QUALITY,
+        metavar="{1-100}",
+        help=f"JPG/WebP quality (default: {logic.DEFAULT_QUALITY}).",
+    )
+
+    parser.add_argument(
+        "--compress",
+        type=int,
+        choices=range(10),
+        default=None,
+        metavar="{0-9}",
+        help="PNG zlib compression level; 1 is fastest with larger files (requires Pillow). "
+             "Default: PyMuPDF's built-in encoder.",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of PDFs (or pages of a single PDF) converted in parallel, "
+             f"up to the CPU count (default: {DEFAULT_WORKERS}).",
+    )
+
     # Parse the args
     args = parser.parse_args()
 
-    # Find PDFs from inputs
-    pdfs = logic.find_pdfs(args.inputs)
+    # Keep within the CPU budget: MuPDF renders each page on one thread,
+    # so worker processes beyond the core count only add memory and contention
+    cpu_count = os.cpu_count() or 1
+    if args.workers > cpu_count:
+        print(f"[INFO] Limiting --workers to {cpu_count} (CPU count).")
+        args.workers = cpu_count
+
+    # WebP and custom compression levels are encoded through Pillow
+    if args.compress is not None and not logic.has_pillow():
+        parser.error("--compress requires Pillow (pip install pillow)")
+    if args.fmt == "webp" and not logic.has_pillow():
+        parser.error("--format webp requires Pillow (pip install pillow)")
+
+    # Start the worker pool before discovery so process start-up overlaps with the walk;
+    # the same pool serves both file-level and page-level work
+    pool = logic.make_pool(args.workers) if args.workers > 1 else None
+
+    try:
+        return _convert_all(args, pool)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+
+# Find and convert all PDFs, using the pool (if any) for parallelism.
+def _convert_all(args: argparse.Namespace, pool: multiprocessing.pool.Pool | None) -> int:
+    # Stream PDFs from inputs; conversion starts while folders are still being walked
+    results = logic.batch_convert(
+        logic.iter_pdfs(args.inputs),
+        workers=args.workers,
+        pool=pool,
+        log=print,
+        dpi=args.dpi,
+        overwrite=args.overwrite,
+        alpha=args.alpha,
+        password=args.password,
+        fmt=args.fmt,
+        compress=args.compress,
+        quality=args.quality,
+    )
+
+    # Log lines are printed as they happen (per PDF for pool workers)
+    total = 0
+    failed: List[logic.ConversionResult] = []
+    for res in results:
+        total += 1
+        if not res.ok:
+            failed.append(res)
 
     # Report if none found
-    if not pdfs:
+    if not total:
         print("[INFO] No PDFs found.")
         return 1
 
-    # Convert each PDF
-    for pdf in pdfs:
-        logic.convert_pdf(
-            pdf,
-            dpi=args.dpi,
-            overwrite=args.overwrite,
-            alpha=args.alpha,
-            password=args.password,
-            log=None,
-        )
-    
+    # Summarize failures (they never stop the batch)
+    if failed:
+        print(f"[INFO] {len(failed)} of {total} PDF(s) had errors:")
+        for res in failed:
+            print(f"  {res.pdf}: {res.error}")
+
     return 0
 
 # Entry point
@@ -81,4 +167,6 @@ if __name__ == "__main__":
     # Exit with the return code from _main()
     # return 1 -> no PDFs found (non-zero exit for scripts)
     # return 0 -> success
+    # freeze_support() is required for worker processes in PyInstaller builds
+    multiprocessing.freeze_support()
     raise SystemExit(_main())
\ No newline at end of file
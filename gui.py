@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-GUI wrapper for pdf_to_png_core with drag-and-drop (tkinterdnd2 required).
+GUI wrapper for logic.py (PDF → PNG/JPG/WebP) with drag-and-drop (tkinterdnd2 required).
 - Drag PDFs/folders into the target area
 - Add via buttons
 - Scrollbars (vertical + horizontal)
@@ -8,9 +8,15 @@ GUI wrapper for pdf_to_png_core with drag-and-drop (tkinterdnd2 required).
 """
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
+import multiprocessing
+import os
+import queue
+import re
 import sys
+import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from tkinterdnd2 import DND_FILES, TkinterDnD
@@ -22,7 +28,17 @@ import logic as core
 APP_TITLE = "PDF → PNG Converter"
 DPI_CHOICES = ["72", "96", "144", "300", "600", "1200", "2400", "3600", "4800"]
 DEFAULT_DPI = "600"
+FORMAT_CHOICES = list(core.FORMATS)
+COMPRESS_CHOICES = ["Default"] + [str(n) for n in range(10)]  # "Default" = PyMuPDF's built-in PNG encoder
 USE_MONO_LIST_FONT = False  # Set True if you prefer monospaced list display
+RESOLVE_THREADS_MIN = 64  # Resolve paths on a thread pool from this many items up
+RESOLVE_THREADS = 8
+LOG_POLL_MS = 50  # How often queued log messages are moved into the logbox
+LOG_BATCH = 200  # Max log messages handled per poll
+WORKERS = min(os.cpu_count() or 1, 4)  # Processes converting PDFs (or the pages of a single PDF)
+PROGRESS_PULSE_MS = 20  # Indeterminate progress animation interval (single-PDF batches)
+FAILURE_LIST_MAX = 20  # Max failed PDFs listed in the summary dialog
+QUIT_JOIN_S = 2.0  # Max wait on quit for a cancelled conversion to stop and release its worker pool
 
 # Optional placeholder image (PNG). Leave as None for text-only.
 PLACEHOLDER_IMAGE: Path | None = None  # e.g., Path(__file__).with_name("dragdrop.png")
@@ -30,38 +46,25 @@ PLACEHOLDER_IMAGE: Path | None = None  # e.g., Path(__file__).with_name("dragdro
 
 # -------------------- Helpers --------------------
 
+# Expand and resolve raw path strings; large batches are resolved on threads (syscalls release the GIL).
+def _resolve_paths(raw: List[str]) -> List[Path]:
+    def resolve(s: str) -> Path:
+        return Path(s).expanduser().resolve()
+
+    if len(raw) < RESOLVE_THREADS_MIN:
+        return [resolve(s) for s in raw]
+
+    with ThreadPoolExecutor(max_workers=RESOLVE_THREADS) as ex:
+        return list(ex.map(resolve, raw))
+
+# TkinterDND2 uses braces to group paths with spaces in them: "{C:/a b.pdf} C:/c.pdf"
+# Group 1 captures a braced path, group 2 a bare (space-free) path.
+_DND_RE = re.compile(r"\{([^}]*)\}|(\S+)")
+
 # Split a DND_FILES payload into individual Path objects (handles braces & spaces).
 def _split_dnd_paths(data: str) -> List[Path]:
-    items: List[str] = []
-    token, brace = "", 0
-    
-    # Loop through characters
-    # TkinterDND2 uses braces to group paths with spaces in them
-    for ch in data:
-        # Handle opening brace
-        if ch == "{":
-            brace += 1
-
-        # Handle closing brace
-        elif ch == "}":
-            brace = max(0, brace - 1)
-        
-        # Handle spaces (only if not in braces)
-        elif ch == " " and brace == 0:
-            # If we have a token, save it
-            if token:
-                items.append(token)
-                token = ""
-        
-        # Regular character
-        else:
-            token += ch
-    
-    # Final token
-    if token:
-        items.append(token)
-    
-    return [Path(s.strip()).expanduser().resolve() for s in items if s.strip()]
+    items = [(braced or bare).strip() for braced, bare in _DND_RE.findall(data)]
+    return _resolve_paths([s for s in items if s])
 
 
 # -------------------- App --------------------
@@ -74,15 +77,25 @@ class App(TkinterDnD.Tk):
         # Window setup
         self.title(APP_TITLE)
         self.minsize(720, 480)
+        self.protocol("WM_DELETE_WINDOW", self._quit)  # Closing the window cancels like Quit
 
         # State
         self.targets: List[Path] = initial_targets[:]
+        self._targets_set: set[Path] = set(initial_targets)  # O(1) membership checks
         self.dpi_var = tk.StringVar(value=DEFAULT_DPI)
         self.alpha_var = tk.BooleanVar(value=True)
         self.overwrite_var = tk.BooleanVar(value=False)
         self.password_var = tk.StringVar(value="")
+        self.compress_var = tk.StringVar(value=COMPRESS_CHOICES[0])
+        self.format_var = tk.StringVar(value=FORMAT_CHOICES[0])
+        self.quality_var = tk.StringVar(value=str(core.DEFAULT_QUALITY))
         self._ph_img_ref = None  # Needs persistent reference
 
+        # Background conversion state
+        self._worker: threading.Thread | None = None
+        self._cancel = threading.Event()
+        self._log_q: queue.Queue = queue.Queue()  # str messages or callables to run on the UI thread
+
         # Build UI
         self._build_ui()
 
@@ -165,10 +178,14 @@ class App(TkinterDnD.Tk):
         # Middle row of buttons
         btns = ttk.Frame(top)
         btns.pack(fill=tk.X, pady=(5, 0))
-        ttk.Button(btns, text="Add PDFs…", command=self._add_pdfs).pack(side=tk.LEFT)
-        ttk.Button(btns, text="Add Folder…", command=self._add_folder).pack(side=tk.LEFT, padx=5)
-        ttk.Button(btns, text="Remove Selected", command=self._remove_selected).pack(side=tk.LEFT, padx=5)
-        ttk.Button(btns, text="Clear All", command=self._clear_all).pack(side=tk.LEFT, padx=5)
+        add_pdfs_btn = ttk.Button(btns, text="Add PDFs…", command=self._add_pdfs)
+        add_pdfs_btn.pack(side=tk.LEFT)
+        add_folder_btn = ttk.Button(btns, text="Add Folder…", command=self._add_folder)
+        add_folder_btn.pack(side=tk.LEFT, padx=5)
+        remove_btn = ttk.Button(btns, text="Remove Selected", command=self._remove_selected)
+        remove_btn.pack(side=tk.LEFT, padx=5)
+        clear_btn = ttk.Button(btns, text="Clear All", command=self._clear_all)
+        clear_btn.pack(side=tk.LEFT, padx=5)
 
         # Placeholder style
         style = ttk.Style(self)
@@ -185,12 +202,24 @@ class App(TkinterDnD.Tk):
 
         # Checkbuttons (alpha & overwrite)
         ttk.Checkbutton(opts, text="Keep transparency (alpha)", variable=self.alpha_var).grid(row=0, column=2, sticky="w", padx=15)
-        ttk.Checkbutton(opts, text="Overwrite existing PNGs", variable=self.overwrite_var).grid(row=0, column=3, sticky="w", padx=15)
+        ttk.Checkbutton(opts, text="Overwrite existing images", variable=self.overwrite_var).grid(row=0, column=3, sticky="w", padx=15)
 
         # Password entry field
         ttk.Label(opts, text="Password (optional):").grid(row=1, column=0, sticky="e", padx=5, pady=5)
         ttk.Entry(opts, textvariable=self.password_var, width=30, show="•").grid(row=1, column=1, sticky="w", padx=5, pady=5, columnspan=3)
 
+        # PNG compression dropdown (levels need Pillow; 1 = fastest, larger files)
+        ttk.Label(opts, text="PNG compression:").grid(row=2, column=0, sticky="e", padx=5, pady=5)
+        compress_combo = ttk.Combobox(opts, textvariable=self.compress_var, values=COMPRESS_CHOICES, state="readonly", width=8)
+        compress_combo.grid(row=2, column=1, sticky="w", padx=5, pady=5)
+
+        # Output format dropdown (jpg has no alpha; webp needs Pillow) + JPG/WebP quality
+        ttk.Label(opts, text="Format:").grid(row=3, column=0, sticky="e", padx=5, pady=5)
+        format_combo = ttk.Combobox(opts, textvariable=self.format_var, values=FORMAT_CHOICES, state="readonly", width=8)
+        format_combo.grid(row=3, column=1, sticky="w", padx=5, pady=5)
+        ttk.Label(opts, text="Quality (jpg/webp):").grid(row=3, column=2, sticky="e", padx=5, pady=5)
+        ttk.Spinbox(opts, textvariable=self.quality_var, from_=1, to=100, width=6).grid(row=3, column=3, sticky="w", padx=5, pady=5)
+
         # Bottom (log + actions)
         bottom = ttk.Frame(self)
         bottom.pack(side=tk.BOTTOM, fill=tk.BOTH, expand=True, padx=pad, pady=(5, pad))
@@ -201,11 +230,21 @@ class App(TkinterDnD.Tk):
         self.logbox = tk.Text(bottom, height=10, wrap="word", state="disabled")
         self.logbox.grid(row=0, column=0, sticky="nsew")
 
+        # Progress bar (one step per converted PDF)
+        self.progress = ttk.Progressbar(bottom, orient="horizontal", mode="determinate")
+        self.progress.grid(row=1, column=0, sticky="ew", pady=(5, 0))
+
         # Bottom row of buttons
         actions = ttk.Frame(bottom)
-        actions.grid(row=1, column=0, sticky="e", pady=(5, 0))
-        ttk.Button(actions, text="Quit", command=self.destroy).pack(side=tk.RIGHT, padx=5)
-        ttk.Button(actions, text="Start", command=self._start).pack(side=tk.RIGHT)
+        actions.grid(row=2, column=0, sticky="e", pady=(5, 0))
+        ttk.Button(actions, text="Quit", command=self._quit).pack(side=tk.RIGHT, padx=5)
+        self.cancel_btn = ttk.Button(actions, text="Cancel", command=self._cancel_batch, state="disabled")
+        self.cancel_btn.pack(side=tk.RIGHT, padx=5)
+        start_btn = ttk.Button(actions, text="Start", command=self._start)
+        start_btn.pack(side=tk.RIGHT)
+
+        # Controls disabled while a batch is running
+        self._controls = [add_pdfs_btn, add_folder_btn, remove_btn, clear_btn, start_btn]
 
     # ---------- Key bindings ----------
     def _bind_keys(self):
@@ -216,14 +255,18 @@ class App(TkinterDnD.Tk):
 
     # ---------- DnD ----------
     def _on_drop_files(self, event):
+        # Ignore drops while a batch is running
+        if self._busy():
+            return
+
         # Track if we added anything
         added = False
 
         # Split and add each path
         for p in _split_dnd_paths(event.data):
             # Only add if it exists and is not already in the list
-            if p.exists() and p not in self.targets:
-                self.targets.append(p)
+            if p not in self._targets_set and p.exists():
+                self._add_target(p)
                 added = True
         
         # Refresh the list if we added anything
@@ -232,6 +275,15 @@ class App(TkinterDnD.Tk):
 
     # ---------- Target list helpers ----------
 
+    # True while a batch is running; the target list is locked until it finishes
+    def _busy(self) -> bool:
+        return self._worker is not None and self._worker.is_alive()
+
+    # Append a target, keeping the membership set in sync
+    def _add_target(self, p: Path):
+        self.targets.append(p)
+        self._targets_set.add(p)
+
     # Refresh the listbox from self.targets
     def _refresh_targets(self):
         # Clear and re-populate
@@ -249,6 +301,10 @@ class App(TkinterDnD.Tk):
 
     # Add PDFs via file dialog
     def _add_pdfs(self):
+        # Ignore while a batch is running (also reached via Ctrl+O)
+        if self._busy():
+            return
+
         # Show file dialog to select PDFs
         paths = filedialog.askopenfilenames(title="Select PDF files", filetypes=[("PDF files", "*.pdf")])
 
@@ -257,18 +313,20 @@ class App(TkinterDnD.Tk):
             return
         
         # Loop over selected paths
-        for s in paths:
-            p = Path(s).expanduser().resolve()
-            
+        for p in _resolve_paths(list(paths)):
             # Only add if it is a PDF and not already in the list
-            if p.is_file() and p.suffix.lower() == ".pdf" and p not in self.targets:
-                self.targets.append(p)
+            if p not in self._targets_set and p.suffix.lower() == ".pdf" and p.is_file():
+                self._add_target(p)
         
         # Refresh the list
         self._refresh_targets()
 
     # Handler for "Add Folder" button
     def _add_folder(self):
+        # Ignore while a batch is running
+        if self._busy():
+            return
+
         # Show folder picker dialog
         folder = filedialog.askdirectory(title="Select folder containing PDFs")
         
@@ -279,26 +337,35 @@ class App(TkinterDnD.Tk):
         p = Path(folder).expanduser().resolve()
 
         # Only add if it is a directory and not already in the list
-        if p.is_dir() and p not in self.targets:
-            self.targets.append(p)
+        if p not in self._targets_set and p.is_dir():
+            self._add_target(p)
 
         # Refresh the list
         self._refresh_targets()
 
     # Remove selected items from the list
     def _remove_selected(self):
+        # Ignore while a batch is running (also reached via Delete)
+        if self._busy():
+            return
+
         # Remove in reverse order to avoid messing up indices
         for idx in reversed(self.listbox.curselection()):
             # Remove the corresponding target
-            del self.targets[idx]
+            self._targets_set.discard(self.targets.pop(idx))
 
         # Refresh the list
         self._refresh_targets()
 
     # Handler for "Clear All" button
     def _clear_all(self):
+        # Ignore while a batch is running (also reached via Ctrl+L)
+        if self._busy():
+            return
+
         # Clear targets from list
         self.targets.clear()
+        self._targets_set.clear()
 
         # Refresh the list
         self._refresh_targets()
@@ -323,14 +390,15 @@ class App(TkinterDnD.Tk):
     # ---------- Convert ----------
     # Handler for "Start" button
     #
-    # NOTE: Currently runs conversion synchronously on the main GUI thread.
-    # This is fine for small jobs, but the UI will freeze during long batches.
-    #
-    # If you ever want responsiveness during large jobs:
-    #   - Move the loop into a worker thread
-    #   - Send log messages back via queue + self.after()
-    #   - Disable controls while the worker is running
+    # Conversion runs on a background thread so the UI stays responsive:
+    #   - Log messages are sent back via a queue and drained with self.after()
+    #   - Controls are disabled while the worker is running
+    #   - "Cancel" sets an event the worker checks between pages
     def _start(self):
+        # Ignore if a batch is already running
+        if self._busy():
+            return
+
         # Check we have targets
         if not self.targets:
             messagebox.showwarning("No targets", "Please add at least one PDF or folder.")
@@ -343,42 +411,162 @@ class App(TkinterDnD.Tk):
             messagebox.showerror("Invalid DPI", f"Invalid DPI value: {self.dpi_var.get()}")
             return
 
-        # Get other options
-        alpha = bool(self.alpha_var.get())
-        overwrite = bool(self.overwrite_var.get())
-        password = self.password_var.get().strip() or None
+        # Validate compression level (custom levels are encoded through Pillow)
+        compress = None if self.compress_var.get() == COMPRESS_CHOICES[0] else int(self.compress_var.get())
+        if compress is not None and not core.has_pillow():
+            messagebox.showerror("Pillow required", "Custom PNG compression levels require Pillow (pip install pillow).")
+            return
 
-        # Find all PDFs from targets
-        all_pdfs = core.find_pdfs([str(p) for p in self.targets])
-        
-        # Abort if none found
-        if not all_pdfs:
-            messagebox.showinfo("No PDFs found", "No PDFs were found in the selected targets.")
+        # Validate format (WebP is encoded through Pillow) and quality
+        fmt = self.format_var.get()
+        if fmt == "webp" and not core.has_pillow():
+            messagebox.showerror("Pillow required", "WebP output requires Pillow (pip install pillow).")
+            return
+        try:
+            quality = int(self.quality_var.get())
+            if not 1 <= quality <= 100:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Invalid quality", f"Quality must be 1-100, got: {self.quality_var.get()}")
             return
 
-        # Log start message
-        self.log(f"Found {len(all_pdfs)} PDF(s). Converting at {dpi} DPI…")
-        
-        # Loop through and convert each PDF
-        for pdf in all_pdfs:
-            # Log the PDF being processed and convert
-            self.log(f"→ {pdf}")
-            core.convert_pdf(pdf, dpi=dpi, overwrite=overwrite, alpha=alpha, password=password, log=self.log)
-        
-        self.log("Done ✅")
+        # Get other options
+        opts = dict(
+            dpi=dpi,
+            alpha=bool(self.alpha_var.get()),
+            overwrite=bool(self.overwrite_var.get()),
+            password=self.password_var.get().strip() or None,
+            fmt=fmt,
+            compress=compress,
+            quality=quality,
+        )
+
+        # Start the worker on a snapshot of the targets
+        self._cancel.clear()
+        self._set_running(True)
+        self._worker = threading.Thread(
+            target=self._run_batch,
+            args=([str(p) for p in self.targets], opts),
+            daemon=True,
+        )
+        self._worker.start()
+        self.after(LOG_POLL_MS, self._drain_log)
+
+    # Worker thread: find and convert PDFs, reporting only through the queue
+    def _run_batch(self, targets: List[str], opts: dict):
+        put = self._log_q.put
+
+        # Start worker processes with "spawn": this thread runs alongside the Tk main loop,
+        # and forking a multi-threaded process can deadlock the child.
+        # Started before discovery so process start-up overlaps with the walk.
+        pool = core.make_pool(WORKERS, start_method="spawn") if WORKERS > 1 else None
+        total = 0
+
+        try:
+            # Find all PDFs from targets
+            all_pdfs = core.find_pdfs(targets)
+
+            # Abort if none found (dialogs must be shown from the main thread)
+            if not all_pdfs:
+                put(lambda: messagebox.showinfo("No PDFs found", "No PDFs were found in the selected targets."))
+                return
+
+            # Log start message and size the progress bar
+            total = len(all_pdfs)
+            put(f"Found {total} PDF(s). Converting to {opts['fmt'].upper()} at {opts['dpi']} DPI…")
+            # A lone PDF is converted page by page, so show activity instead of a PDF count
+            if total == 1:
+                put(lambda: (self.progress.configure(mode="indeterminate"), self.progress.start(PROGRESS_PULSE_MS)))
+            else:
+                put(lambda: self.progress.configure(mode="determinate", maximum=total, value=0))
+
+            # Convert PDFs in parallel processes (or the pages of a single PDF);
+            # log lines arrive live (per PDF from pool workers), results as each PDF completes
+            failed: List[core.ConversionResult] = []
+            for res in core.batch_convert(all_pdfs, workers=WORKERS, pool=pool, cancel=self._cancel, log=put, **opts):
+                put(lambda: self.progress.step(1))
+
+                if not res.ok:
+                    failed.append(res)
+
+            put("Cancelled ⛔" if self._cancel.is_set() else "Done ✅")
+
+            # Summarize failures (they never stop the batch)
+            if failed and not self._cancel.is_set():
+                lines = [f"{res.pdf.name}: {res.error}" for res in failed[:FAILURE_LIST_MAX]]
+                if len(failed) > FAILURE_LIST_MAX:
+                    lines.append(f"…and {len(failed) - FAILURE_LIST_MAX} more (see log).")
+                summary = f"{len(failed)} of {total} PDF(s) had errors:\n\n" + "\n".join(lines)
+                put(lambda: messagebox.showwarning("Conversion errors", summary))
+        except Exception as e:
+            put(f"[ERROR] {e}")
+        finally:
+            # Also stops any PDFs still queued in the pool after a cancel
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+
+            # Stop the single-PDF progress animation, even if the batch failed
+            if total == 1:
+                put(lambda: (self.progress.stop(), self.progress.configure(mode="determinate", maximum=1, value=1)))
+
+    # Move queued log messages into the logbox; reschedules itself while the worker runs
+    def _drain_log(self):
+        msgs: List[str] = []
+
+        # Pop a bounded number of items per tick to keep the UI responsive
+        for _ in range(LOG_BATCH):
+            try:
+                item = self._log_q.get_nowait()
+            except queue.Empty:
+                break
+
+            # Callables are UI actions posted by the worker
+            if callable(item):
+                item()
+            else:
+                msgs.append(item)
+
+        if msgs:
+            self.log("\n".join(msgs))
+
+        # Keep polling until the worker is done and the queue is empty
+        if (self._worker is not None and self._worker.is_alive()) or not self._log_q.empty():
+            self.after(LOG_POLL_MS, self._drain_log)
+        else:
+            self._set_running(False)
+
+    # Enable/disable controls while a batch runs
+    def _set_running(self, running: bool):
+        state = "disabled" if running else "normal"
+        for btn in self._controls:
+            btn.configure(state=state)
+        self.cancel_btn.configure(state="normal" if running else "disabled")
+
+    # Handler for "Cancel" button
+    def _cancel_batch(self):
+        if self._worker is not None and self._worker.is_alive():
+            self._cancel.set()
+            self.log("Cancelling…")
+
+    # Handler for "Quit" button; asks a running worker to stop first
+    def _quit(self):
+        # Cancel a running batch and give it a moment to stop (and terminate its pool)
+        # before the interpreter exits and kills the daemon worker thread
+        self._cancel.set()
+        if self._worker is not None and self._worker.is_alive():
+            self._worker.join(timeout=QUIT_JOIN_S)
+        self.destroy()
 
 
 # -------------------- Entry --------------------
 def main(argv: List[str]) -> int:
-    initial: List[Path] = []
-    
     # Process command-line args as initial targets
-    for raw in argv:
-        p = Path(raw).expanduser().resolve()
-        
-        # Only add if it exists and is not already in the list
-        if p.exists() and p not in initial:
-            initial.append(p)
+    # dict.fromkeys de-duplicates in O(1) per item while keeping order
+    resolved = dict.fromkeys(_resolve_paths(argv))
+
+    # Only add if it exists
+    initial: List[Path] = [p for p in resolved if p.exists()]
     
     # Start the app
     App(initial).mainloop()
@@ -387,4 +575,6 @@ def main(argv: List[str]) -> int:
 
 # Entry point
 if __name__ == "__main__":
+    # freeze_support() is required for worker processes in PyInstaller builds
+    multiprocessing.freeze_support()
     raise SystemExit(main(sys.argv[1:]))
\ No newline at end of file
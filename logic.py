@@ -1,118 +1,464 @@
 #!/usr/bin/env python3
 """
-Core logic for converting PDFs to PNGs using PyMuPDF.
+Core logic for converting PDFs to PNG/JPG/WebP images using PyMuPDF.
 
 Public API:
+- iter_pdfs(inputs: Iterable[str]) -> Iterator[Path]
 - find_pdfs(inputs: Iterable[str]) -> list[Path]
+- has_pillow() -> bool
+- make_pool(workers: int, start_method: str | None = None) -> multiprocessing.pool.Pool
+- batch_convert(pdfs: Iterable[Path], *, workers: int = 1,
+                pool: multiprocessing.pool.Pool | None = None,
+                cancel: threading.Event | None = None,
+                log: Callable[[str], None] | None = None, **opts) -> Iterator[ConversionResult]
 - convert_pdf(pdf_path: Path, *, dpi: int, overwrite: bool, alpha: bool,
-              password: str | None, log: Callable[[str], None] | None = None) -> None
+              password: str | None, fmt: str = "png", compress: int | None = None,
+              quality: int = DEFAULT_QUALITY, log: Callable[[str], None] | None = None,
+              page_workers: int = 1, pool: multiprocessing.pool.Pool | None = None,
+              cancel: threading.Event | None = None) -> ConversionResult
 """
 
 from __future__ import annotations
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import chain, islice
 from pathlib import Path
-from typing import Iterable, Callable
+from typing import Iterable, Iterator, Callable
+import gc
+import importlib.util
+import multiprocessing
+import multiprocessing.pool
+import os
+import queue
+import signal
+import sys
+import threading
+import time
 import pymupdf
 
 
+# Output image formats (also the file extensions) and the default JPG/WebP quality
+FORMATS = ("png", "jpg", "webp")
+DEFAULT_QUALITY = 90
+
+# Minimum page count before pages of one PDF are rendered in parallel
+PARALLEL_MIN_PAGES = 4
+
+# Page chunks handed to each worker when rendering pages of one PDF in parallel
+PAGE_CHUNKS_PER_WORKER = 4
+
+# Maximum threads used to scan input folders concurrently
+MAX_SCAN_THREADS = 8
+
+# Background threads writing page images, and the cap on encoded pages waiting to be written
+WRITE_THREADS = 4
+MAX_PENDING_WRITES = 8
+
+# Seconds between cancel checks while waiting for pool results
+CANCEL_POLL_S = 0.2
+
+# Pages rendered between memory trims (gc + MuPDF store flush), counted per process across PDFs
+TRIM_EVERY_PAGES = 50
+
+
+# Outcome of converting one PDF.
+@dataclass
+class ConversionResult:
+    pdf: Path
+    pages_done: int = 0
+    pages_skipped: int = 0
+    error: str | None = None  # First failure (open/password/render/cancel), None if all went well
+    time_ms: float = 0.0
+    messages: list[str] = field(default_factory=list)  # Log lines, in order
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 # ---------------- Utilities ----------------
 
 # Write a message to the provided logger or stdout.
 def _say(msg: str, log: Callable[[str], None] | None) -> None:
     (log or print)(msg)
 
+# Yield PDF file paths (as strings) under root, walking with os.scandir (cached stat, no Path objects).
+def _iter_pdfs(root: str) -> Iterator[str]:
+    stack = [root]
+
+    while stack:
+        # Unreadable directories are skipped, like rglob does
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+
+        with it:
+            for e in it:
+                try:
+                    # Do not follow directory symlinks (avoids cycles)
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append(e.path)
+                    # Filter by extension in a case-insensitive way
+                    elif e.name[-4:].lower() == ".pdf" and e.is_file():
+                        yield e.path
+                except OSError:
+                    continue
+
+# Resolve inputs and drop redundant roots, keeping input order: duplicates, and
+# anything inside another input folder (that folder's walk already covers it).
+def _resolve_roots(inputs: Iterable[str]) -> list[Path]:
+    resolved = list(dict.fromkeys(Path(raw).expanduser().resolve() for raw in inputs))
+
+    # Visit shallow paths first so a parent folder is kept before its subfolders
+    dirs: set[Path] = set()
+    for p in sorted(resolved, key=lambda p: len(p.parts)):
+        if p.is_dir() and not any(a in dirs for a in p.parents):
+            dirs.add(p)
+
+    return [p for p in resolved if p in dirs or not any(a in dirs for a in p.parents)]
+
+# Yield the PDF paths (as strings) found under one resolved input file/folder.
+def _scan_one_root(p: Path) -> Iterator[str]:
+    # Check if it is a PDF
+    if p.is_file() and p.suffix.lower() == ".pdf":
+        yield str(p)
+
+    # Check if it is a directory
+    elif p.is_dir():
+        # Recursively scan directory; root is already resolved, so paths below it are absolute
+        yield from _iter_pdfs(str(p))
+
+    # Silently ignore non-existent / non-PDF items
+
+# Yield de-duplicated PDF paths from files/folders as they are found (folders searched recursively).
+# Lets callers start converting before the whole walk has finished.
+def iter_pdfs(inputs: Iterable[str]) -> Iterator[Path]:
+    roots = _resolve_roots(inputs)
+    seen: set[str] = set()
+
+    # Single root: stream straight from the walk
+    if len(roots) <= 1:
+        for root in roots:
+            for s in _scan_one_root(root):
+                if s not in seen:
+                    seen.add(s)
+                    yield Path(s)
+        return
+
+    # Several roots: scan them concurrently (directory I/O releases the GIL),
+    # with each scanner pushing hits into a shared queue as it finds them
+    q: queue.Queue[str | None] = queue.Queue()
+
+    def produce(root: Path) -> None:
+        try:
+            for s in _scan_one_root(root):
+                q.put(s)
+        finally:
+            q.put(None)  # Marks this root as done
+
+    with ThreadPoolExecutor(max_workers=min(MAX_SCAN_THREADS, len(roots))) as ex:
+        for root in roots:
+            ex.submit(produce, root)
+
+        # Consume until every root has reported done
+        pending = len(roots)
+        while pending:
+            s = q.get()
+            if s is None:
+                pending -= 1
+            elif s not in seen:
+                seen.add(s)
+                yield Path(s)
+
 # Return a de-duplicated list of PDF paths from files/folders (folders searched recursively).
 def find_pdfs(inputs: Iterable[str]) -> list[Path]:
-    seen: set[Path] = set()
-    out: list[Path] = []
-
-    for raw in inputs:
-        p = Path(raw).expanduser().resolve()
-        
-        # Check if it is a PDF
-        if p.is_file() and p.suffix.lower() == ".pdf":
-            if p not in seen:
-                seen.add(p)
-                out.append(p)
-        
-        # Check if it is a directory
-        elif p.is_dir():
-            # Recursively scan directory; filter by extension in a case-insensitive way
-            for path in p.rglob("*.[Pp][Dd][Ff]"):
-                path = path.resolve()
-                if path not in seen:
-                    seen.add(path)
-                    out.append(path)
-
-        # Silently ignore non-existent / non-PDF items
-
-    return out
+    return list(iter_pdfs(inputs))
+
+
+# Return True if Pillow is installed (needed for WebP and custom PNG compression levels).
+def has_pillow() -> bool:
+    return importlib.util.find_spec("PIL") is not None
+
+
+# ---------------- Worker pool ----------------
+
+# One-time setup in each worker process.
+# PyMuPDF itself is loaded once per worker, when the worker imports this module at start-up.
+def _worker_init() -> None:
+    # Ctrl+C is handled by the parent, which tears the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+# Start a persistent worker pool; create it early so worker start-up overlaps with PDF discovery.
+# Worker functions must live at module level so they can be pickled (required under "spawn").
+# start_method overrides the platform default; callers with other threads running (e.g. a GUI)
+# should pass "spawn", since forking a multi-threaded process can deadlock the child.
+def make_pool(workers: int, start_method: str | None = None) -> multiprocessing.pool.Pool:
+    # Windows only supports "spawn"; request it explicitly there
+    if sys.platform == "win32":
+        start_method = "spawn"
+    ctx = multiprocessing.get_context(start_method)
+    return ctx.Pool(processes=max(1, workers), initializer=_worker_init)
 
 
 # ---------------- Conversion ----------------
 
-# Convert one PDF to PNG(s) next to it.
-def convert_pdf(
+# Compute render scale: PDFs are 72 points/in; scale = requested_dpi / 72
+def _zoom(dpi: int) -> pymupdf.Matrix:
+    scale = max(dpi, 1) / 72.0
+    return pymupdf.Matrix(scale, scale)
+
+# Encode a rendered page in the requested output format.
+# PNG: compress=None uses MuPDF's built-in encoder; 0-9 sets the zlib level via Pillow
+# (1 encodes faster than the default, at the cost of larger files).
+# JPG: MuPDF's built-in encoder (no alpha). WebP: encoded via Pillow.
+def _encode_image(pix: pymupdf.Pixmap, fmt: str, compress: int | None, quality: int) -> bytes:
+    if fmt == "jpg":
+        return pix.tobytes("jpg", jpg_quality=quality)
+    if fmt == "webp":
+        return pix.pil_tobytes("WEBP", quality=quality)
+    if compress is None:
+        return pix.tobytes("png")
+    return pix.pil_tobytes("PNG", optimize=False, compress_level=compress)
+
+# Release memory held by garbage cycles and MuPDF's internal resource store (fonts, images).
+def _trim_memory() -> None:
+    gc.collect()
+    pymupdf.TOOLS.store_shrink(100)
+
+# Pages rendered by this process since the last trim (main process or pool worker).
+_pages_since_trim = 0
+
+# Count one rendered page; every TRIM_EVERY_PAGES pages (across PDFs), trim memory.
+# Trimming per PDF would cost a gc pass and discard MuPDF's shared font cache for every file.
+def _page_rendered() -> None:
+    global _pages_since_trim
+    _pages_since_trim += 1
+    if _pages_since_trim >= TRIM_EVERY_PAGES:
+        _pages_since_trim = 0
+        _trim_memory()
+
+# Write encoded image bytes to disk, then free a slot for the next pending write.
+def _write_file(path: str, data: bytes, slots: threading.Semaphore) -> None:
+    try:
+        with open(path, "wb") as f:
+            f.write(data)
+    finally:
+        slots.release()
+
+# Render the given pages of an open multi-page PDF into "<name>/" as "<name> - Pg N.<fmt>".
+# Files are written on a small thread pool so disk I/O overlaps with rendering the next page.
+def _render_pages(
+    doc: pymupdf.Document,
     pdf_path: Path,
-    *, # '*' makes everything after it keyword-only: must call with dpi=..., overwrite=..., etc.
+    pages: Iterable[int],
+    *,
+    zoom: pymupdf.Matrix,
+    overwrite: bool,
+    alpha: bool,
+    fmt: str,
+    compress: int | None,
+    quality: int,
+    say: Callable[[str], None],
+    cancel: threading.Event | None = None,
+) -> tuple[int, int, int]:
+    # Hoist per-document values out of the page loop; output paths are plain strings
+    # ("<out_dir>/<name> - Pg " + N + ".<fmt>"), so no Path object is built per page
+    name = pdf_path.name
+    stem = pdf_path.stem
+    out_prefix = os.path.join(str(pdf_path.parent / stem), f"{stem} - Pg ")
+    out_ext = f".{fmt}"
+    exists = os.path.exists
+    load_page = doc.load_page
+
+    # Bound the number of encoded pages held in memory while waiting for the disk
+    slots = threading.Semaphore(MAX_PENDING_WRITES)
+    writes: dict[Future, int] = {}
+    done = skipped = failed = 0
+
+    with ThreadPoolExecutor(max_workers=WRITE_THREADS) as io_pool:
+        for i in pages:
+            # Stop between pages when cancelled
+            if cancel is not None and cancel.is_set():
+                break
+
+            out_file = f"{out_prefix}{i+1}{out_ext}"
+
+            # Skip if exists and not overwriting
+            if not overwrite and exists(out_file):
+                say(f"[SKIP] Exists (use --overwrite): {out_file}")
+                skipped += 1
+                continue
+
+            # Render and encode
+            try:
+                pix = load_page(i).get_pixmap(matrix=zoom, alpha=alpha)
+                data = _encode_image(pix, fmt, compress, quality)
+            except Exception as e:
+                say(f"[WARN] Failed to render/save '{name}' Pg {i+1}: {e}")
+                failed += 1
+                continue
+            finally:
+                # Free the raw pixmap now rather than at the next page (600 DPI RGBA ≈ 140 MB)
+                pix = None
+
+            # Queue the write (blocks while too many writes are pending);
+            # the pending write holds the only reference to the encoded bytes
+            slots.acquire()
+            writes[io_pool.submit(_write_file, out_file, data, slots)] = i
+            data = None
+
+            # Every few pages, reap reference cycles and flush MuPDF's resource cache
+            _page_rendered()
+
+        # Report failed writes as they finish
+        for fut in as_completed(writes):
+            try:
+                fut.result()
+                done += 1
+            except Exception as e:
+                say(f"[WARN] Failed to render/save '{name}' Pg {writes[fut]+1}: {e}")
+                failed += 1
+
+    # Counts of pages written, skipped (already exist) and failed
+    return done, skipped, failed
+
+# Worker-process entry: open the PDF independently and render a slice of its pages.
+# PyMuPDF documents are not thread-safe and cannot be pickled, so each process opens its own.
+# Returns the collected log lines and the (done, skipped, failed) page counts.
+def _render_pages_worker(
+    pdf_path: Path,
+    pages: range,
     dpi: int,
     overwrite: bool,
     alpha: bool,
     password: str | None,
-    log: Callable[[str], None] | None = None,
+    fmt: str,
+    compress: int | None,
+    quality: int,
+) -> tuple[list[str], int, int, int]:
+    lines: list[str] = []
+
+    try:
+        doc = pymupdf.open(pdf_path)
+    except Exception as e:
+        return [f"[ERROR] Could not open '{pdf_path.name}': {e}"], 0, 0, len(pages)
+
+    try:
+        # The parent already verified the password; just unlock this copy
+        if getattr(doc, "needs_pass", False):
+            doc.authenticate(password or "")
+
+        counts = _render_pages(
+            doc, pdf_path, pages, zoom=_zoom(dpi), overwrite=overwrite, alpha=alpha,
+            fmt=fmt, compress=compress, quality=quality, say=lines.append,
+        )
+    finally:
+        try: doc.close()
+        except Exception: pass
+
+    return (lines, *counts)
+
+# Pool.imap passes a single argument; unpack it for _render_pages_worker.
+def _render_pages_task(args: tuple) -> tuple[list[str], int, int, int]:
+    return _render_pages_worker(*args)
+
+# Fast path for single-page PDFs: all checks are done by the caller, so just render and save.
+def _convert_one_page_fast(
+    doc: pymupdf.Document,
+    out_file: Path,
+    zoom: pymupdf.Matrix,
+    alpha: bool,
+    fmt: str,
+    compress: int | None,
+    quality: int,
+) -> None:
+    # Render page to bitmap; alpha=True keeps transparency (RGBA)
+    out_file.write_bytes(_encode_image(doc[0].get_pixmap(matrix=zoom, alpha=alpha), fmt, compress, quality))
+
+# Body of convert_pdf: does the work and fills in result.
+def _convert_pdf(
+    pdf_path: Path,
+    result: ConversionResult,
+    say: Callable[[str], None],
+    *,
+    dpi: int,
+    overwrite: bool,
+    alpha: bool,
+    password: str | None,
+    fmt: str,
+    compress: int | None,
+    quality: int,
+    page_workers: int,
+    pool: multiprocessing.pool.Pool | None,
+    cancel: threading.Event | None,
 ) -> None:
-    
-    # Local logger
-    def say(m: str) -> None: _say(m, log)
+    # Record a failure on the result and log it
+    def fail(error: str, m: str) -> None:
+        result.error = error
+        say(m)
+
+    # JPG cannot store transparency
+    if fmt == "jpg":
+        alpha = False
+
+    # Already converted as a single page ("<name>.<fmt>" newer than the PDF and no
+    # "<name>/" folder): skip before opening, so the PDF is never parsed. An older
+    # image may be unrelated to a multi-page PDF, so that case is opened and checked.
+    # The stat result is reused by the single-page path below.
+    stem = pdf_path.stem
+    parent = pdf_path.parent
+    single_file = parent / f"{stem}.{fmt}"
+    single_exists = not overwrite and single_file.exists()
+    if (single_exists and not (parent / stem).is_dir()
+            and single_file.stat().st_mtime >= pdf_path.stat().st_mtime):
+        result.pages_skipped = 1
+        say(f"[SKIP] Exists (use --overwrite): {single_file}")
+        return
 
     # Try to open the PDF; if it fails (missing/corrupt/unsupported), log and stop
     try:
         doc = pymupdf.open(pdf_path)
     except Exception as e:
-        say(f"[ERROR] Could not open '{pdf_path.name}': {e}")
+        fail(f"Could not open: {e}", f"[ERROR] Could not open '{pdf_path.name}': {e}")
         return
 
     try:
         # Handle encryption (require and verify password if needed)
-        if getattr(doc, "needs_pass", False):
+        if doc.needs_pass:
             if not password or not doc.authenticate(password):
-                say(f"[ERROR] Password required/failed for '{pdf_path.name}'. Skipping.")
+                fail("Password required/failed", f"[ERROR] Password required/failed for '{pdf_path.name}'. Skipping.")
                 return
 
         # Check page count
         page_count = doc.page_count
         if page_count == 0:
-            say(f"[WARN] '{pdf_path.name}' has 0 pages. Skipping.")
+            fail("PDF has 0 pages", f"[WARN] '{pdf_path.name}' has 0 pages. Skipping.")
             return
 
-        # Compute render scale: PDFs are 72 points/in; scale = requested_dpi / 72
-        scale = max(dpi, 1) / 72.0 
-        zoom = pymupdf.Matrix(scale, scale)
+        # Render scale for the requested DPI
+        zoom = _zoom(dpi)
 
-        # Prepare output paths
-        stem = pdf_path.stem
-        parent = pdf_path.parent
-
-        # For single-page PDFs
+        # For single-page PDFs (the most common case): saved as "<name>.<fmt>" next to the PDF
         if page_count == 1:
-            # Save single-page as "<name>.png" next to the PDF (path-join via pathlib "/")
-            out_png = parent / f"{stem}.png"
-
-            # Skip if exists and not overwriting
-            if out_png.exists() and not overwrite:
-                say(f"[SKIP] Exists (use --overwrite): {out_png}")
+            # Skip if exists and not overwriting (already checked before opening)
+            if single_exists:
+                result.pages_skipped = 1
+                say(f"[SKIP] Exists (use --overwrite): {single_file}")
                 return
 
             # Render and save
             try:
-                page = doc.load_page(0)
-                # Render page to bitmap; alpha=True keeps transparency (RGBA)
-                pix = page.get_pixmap(matrix=zoom, alpha=alpha)
-                pix.save(out_png)
+                _convert_one_page_fast(doc, single_file, zoom, alpha, fmt, compress, quality)
             except Exception as e:
-                say(f"[WARN] Failed to render/save '{pdf_path.name}' Pg 1: {e}")
+                fail(f"Pg 1: {e}", f"[WARN] Failed to render/save '{pdf_path.name}' Pg 1: {e}")
                 return
-            
-            say(f"[OK] {pdf_path.name} -> {out_png.name}")
+            finally:
+                _page_rendered()
+
+            result.pages_done = 1
+            say(f"[OK] {pdf_path.name} -> {single_file.name}")
             return
 
         # For multi-page PDFs, create output directory
@@ -120,23 +466,70 @@ def convert_pdf(
         out_dir.mkdir(parents=True, exist_ok=True)
 
         # Convert each page
-        # Multi-page -> "<name>/" with "<name> - Pg N.png"
-        for i in range(page_count):
-            out_png = out_dir / f"{stem} - Pg {i+1}.png"
+        # Multi-page -> "<name>/" with "<name> - Pg N.<fmt>"
+        failed = 0
+        workers = min(page_workers, page_count)
+        if workers > 1 and page_count >= PARALLEL_MIN_PAGES:
+            # Split pages into contiguous chunks, ~PAGE_CHUNKS_PER_WORKER per worker:
+            # each task opens the document once for several pages (low IPC overhead),
+            # while several chunks per worker keep the load balanced and cancel responsive
+            chunk = max(1, page_count // (workers * PAGE_CHUNKS_PER_WORKER))
+            slices = [range(k, min(k + chunk, page_count)) for k in range(0, page_count, chunk)]
 
-            # Skip if exists and not overwriting
-            if out_png.exists() and not overwrite:
-                say(f"[SKIP] Exists (use --overwrite): {out_png}")
-                continue
+            tasks = [
+                (pdf_path, pages, dpi, overwrite, alpha, password, fmt, compress, quality)
+                for pages in slices
+            ]
+
+            # Use the caller's pool if given, otherwise a temporary one
+            own_pool = pool is None
+            if own_pool:
+                pool = make_pool(workers)
 
-            # Render and save
             try:
-                page = doc.load_page(i)
-                pix = page.get_pixmap(matrix=zoom, alpha=alpha)
-                pix.save(out_png)
+                chunks = pool.imap(_render_pages_task, tasks)
+                while True:
+                    # Wait in short slices so a cancel is noticed while a chunk is still rendering
+                    # (a temporary pool is terminated below; a caller's pool by the caller)
+                    try:
+                        lines, done, skipped, failed_pages = chunks.next(timeout=CANCEL_POLL_S)
+                    except multiprocessing.TimeoutError:
+                        if cancel is not None and cancel.is_set():
+                            break
+                        continue
+                    except StopIteration:
+                        break
+
+                    for line in lines:
+                        say(line)
+                    result.pages_done += done
+                    result.pages_skipped += skipped
+                    failed += failed_pages
+
+                    if cancel is not None and cancel.is_set():
+                        break
             except Exception as e:
-                say(f"[WARN] Failed to render/save '{pdf_path.name}' Pg {i+1}: {e}")
-                continue
+                fail(f"Page worker failed: {e}", f"[WARN] Page worker failed for '{pdf_path.name}': {e}")
+                return
+            finally:
+                if own_pool:
+                    pool.terminate()
+                    pool.join()
+        else:
+            done, skipped, failed = _render_pages(
+                doc, pdf_path, range(page_count), zoom=zoom, overwrite=overwrite, alpha=alpha,
+                fmt=fmt, compress=compress, quality=quality, say=say, cancel=cancel,
+            )
+            result.pages_done, result.pages_skipped = done, skipped
+
+        if cancel is not None and cancel.is_set():
+            fail("Cancelled", f"[INFO] Cancelled '{pdf_path.name}'.")
+            return
+
+        if failed:
+            fail(f"{failed} page(s) failed",
+                 f"[WARN] {pdf_path.name} -> {out_dir}/(Pg 1..{page_count}): {failed} page(s) failed")
+            return
 
         say(f"[OK] {pdf_path.name} -> {out_dir}/(Pg 1..{page_count})")
 
@@ -146,6 +539,130 @@ def convert_pdf(
         try: doc.close()
         except Exception: pass
 
+# Convert one PDF to image(s) next to it; returns a ConversionResult (also logged line by line).
+def convert_pdf(
+    pdf_path: Path,
+    *, # '*' makes everything after it keyword-only: must call with dpi=..., overwrite=..., etc.
+    dpi: int,
+    overwrite: bool,
+    alpha: bool,
+    password: str | None,
+    fmt: str = "png",
+    compress: int | None = None,
+    quality: int = DEFAULT_QUALITY,
+    log: Callable[[str], None] | None = None,
+    page_workers: int = 1,
+    pool: multiprocessing.pool.Pool | None = None,
+    cancel: threading.Event | None = None,
+) -> ConversionResult:
+    result = ConversionResult(pdf=pdf_path)
+    start = time.perf_counter()
+
+    # Local logger; also keeps the messages on the result
+    def say(m: str) -> None:
+        result.messages.append(m)
+        _say(m, log)
+
+    # Any unexpected error (e.g. output folder blocked, permission denied) fails only this PDF
+    try:
+        _convert_pdf(
+            pdf_path, result, say,
+            dpi=dpi, overwrite=overwrite, alpha=alpha, password=password,
+            fmt=fmt, compress=compress, quality=quality,
+            page_workers=page_workers, pool=pool, cancel=cancel,
+        )
+    except Exception as e:
+        result.error = str(e)
+        say(f"[ERROR] Failed to convert '{pdf_path.name}': {e}")
+
+    result.time_ms = (time.perf_counter() - start) * 1000.0
+    return result
+
+
+# ---------------- Batch API ----------------
+
+# Pool worker for batch_convert: convert one PDF quietly; messages travel back on the result.
+def _batch_task(pdf_path: Path, opts: dict) -> ConversionResult:
+    return convert_pdf(pdf_path, **opts, log=_discard)
+
+# Logger that drops messages (they are kept on the ConversionResult instead).
+def _discard(msg: str) -> None:
+    pass
+
+# Convert many PDFs, yielding a ConversionResult per PDF as each one completes (one failure
+# never stops the batch). With workers > 1, PDFs are converted in parallel processes; a lone
+# PDF has its pages split across the workers instead. opts are convert_pdf's conversion
+# options (dpi, overwrite, alpha, password, fmt, compress, quality). Every log message is
+# passed to log exactly once: live (per page) for in-process and single-PDF conversion, and
+# per finished PDF for pool workers; without log, messages are only kept on the results.
+# On cancel, a pool created here is terminated at once; a caller-supplied pool must be
+# terminated by the caller.
+def batch_convert(
+    pdfs: Iterable[Path],
+    *,
+    workers: int = 1,
+    pool: multiprocessing.pool.Pool | None = None,
+    cancel: threading.Event | None = None,
+    log: Callable[[str], None] | None = None,
+    **opts,
+) -> Iterator[ConversionResult]:
+    pdf_iter = iter(pdfs)
+    log = log or _discard
+
+    # Peek at the first two PDFs to pick a strategy
+    head = list(islice(pdf_iter, 2))
+    if not head:
+        return
+
+    # Single PDF: spend the workers on its pages instead
+    if len(head) == 1:
+        yield convert_pdf(head[0], **opts, log=log, page_workers=workers, pool=pool, cancel=cancel)
+        return
+
+    pdf_iter = chain(head, pdf_iter)
+
+    # Single worker: convert in-process (no pool start-up cost)
+    if workers <= 1 and pool is None:
+        for pdf in pdf_iter:
+            if cancel is not None and cancel.is_set():
+                return
+            yield convert_pdf(pdf, **opts, log=log, cancel=cancel)
+        return
+
+    # Convert PDFs in parallel; each worker opens its own document.
+    # Results are yielded as each PDF completes. Note the pool's task handler queues
+    # the remaining PDFs from pdfs eagerly, not one at a time.
+    own_pool = pool is None
+    if own_pool:
+        pool = make_pool(workers)
+
+    try:
+        results = pool.imap_unordered(partial(_batch_task, opts=opts), pdf_iter, chunksize=1)
+        while True:
+            # Wait in short slices so a cancel is noticed while PDFs are still converting
+            try:
+                result = results.next(timeout=CANCEL_POLL_S)
+            except multiprocessing.TimeoutError:
+                if cancel is not None and cancel.is_set():
+                    return
+                continue
+            except StopIteration:
+                return
+
+            # Worker messages cannot be streamed across processes; log them per PDF
+            for line in result.messages:
+                log(line)
+            yield result
+
+            if cancel is not None and cancel.is_set():
+                return
+    finally:
+        # A temporary pool is terminated here, stopping in-flight and queued PDFs. A
+        # caller-supplied pool keeps running its queued PDFs; the caller terminates it on cancel.
+        if own_pool:
+            pool.terminate()
+            pool.join()
+
 
 # Entry (point for direct run, which we do not want)
 if __name__ == "__main__":